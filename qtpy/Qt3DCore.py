@@ -32,14 +32,16 @@ elif PYQT6:
 elif PYSIDE2:
     # https://bugreports.qt.io/projects/PYSIDE/issues/PYSIDE-1026
     import PySide2.Qt3DCore as __temp
-    import inspect
-
-    for __name in inspect.getmembers(__temp.Qt3DCore):
-        globals()[__name[0]] = __name[1]
+    globals().update(
+        (__name, __value)
+        for __name, __value in vars(__temp.Qt3DCore).items()
+        if not __name.startswith('_')
+    )
 elif PYSIDE6:
     # https://bugreports.qt.io/projects/PYSIDE/issues/PYSIDE-1026
     import PySide6.Qt3DCore as __temp
-    import inspect
-
-    for __name in inspect.getmembers(__temp.Qt3DCore):
-        globals()[__name[0]] = __name[1]
+    globals().update(
+        (__name, __value)
+        for __name, __value in vars(__temp.Qt3DCore).items()
+        if not __name.startswith('_')
+    )
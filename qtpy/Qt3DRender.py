@@ -7,6 +7,8 @@
 
 """Provides Qt3DRender classes and functions."""
 
+import importlib
+
 from . import (
     PYQT5,
     PYQT6,
@@ -17,14 +19,14 @@ from . import (
 
 if PYQT5:
     try:
-        from PyQt5.Qt3DRender import *
+        _Qt3DRender = importlib.import_module('PyQt5.Qt3DRender')
     except ModuleNotFoundError as error:
         raise QtModuleNotInstalledError(
             name='Qt3DRender', missing_package='PyQt3D'
         ) from error
 elif PYQT6:
     try:
-        from PyQt6.Qt3DRender import *
+        _Qt3DRender = importlib.import_module('PyQt6.Qt3DRender')
     except ModuleNotFoundError as error:
         raise QtModuleNotInstalledError(
             name='Qt3DRender', missing_package='PyQt6-3D'
@@ -32,14 +34,27 @@ elif PYQT6:
 elif PYSIDE2:
     # https://bugreports.qt.io/projects/PYSIDE/issues/PYSIDE-1026
     import PySide2.Qt3DRender as __temp
-    import inspect
 
-    for __name in inspect.getmembers(__temp.Qt3DRender):
-        globals()[__name[0]] = __name[1]
+    _Qt3DRender = __temp.Qt3DRender
 elif PYSIDE6:
     # https://bugreports.qt.io/projects/PYSIDE/issues/PYSIDE-1026
     import PySide6.Qt3DRender as __temp
-    import inspect
 
-    for __name in inspect.getmembers(__temp.Qt3DRender):
-        globals()[__name[0]] = __name[1]
+    _Qt3DRender = __temp.Qt3DRender
+
+
+def __getattr__(name):
+    """Custom getattr to resolve names lazily from the binding."""
+    if name == '__all__':
+        value = [attr for attr in dir(_Qt3DRender) if not attr.startswith('_')]
+    elif name.startswith('_') or not hasattr(_Qt3DRender, name):
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    else:
+        value = getattr(_Qt3DRender, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the names of the module, including the not yet resolved ones."""
+    return sorted(set(globals()) | set(__getattr__('__all__')))
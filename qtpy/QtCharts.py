@@ -36,10 +36,11 @@ elif PYSIDE2:
 
     # https://bugreports.qt.io/projects/PYSIDE/issues/PYSIDE-1026
     import PySide2.QtCharts as __temp
-    import inspect
-
-    for __name in inspect.getmembers(__temp.QtCharts):
-        globals()[__name[0]] = __name[1]
+    globals().update(
+        (__name, __value)
+        for __name, __value in vars(__temp.QtCharts).items()
+        if not __name.startswith('_')
+    )
 elif PYSIDE6:
     from PySide6.QtCharts import *
     from PySide6 import QtCharts
@@ -33,9 +33,10 @@ elif PYQT6:
 elif PYSIDE2:
     # https://bugreports.qt.io/projects/PYSIDE/issues/PYSIDE-1026
     import PySide2.QtDataVisualization as __temp
-    import inspect
-
-    for __name in inspect.getmembers(__temp.QtDataVisualization):
-        globals()[__name[0]] = __name[1]
+    globals().update(
+        (__name, __value)
+        for __name, __value in vars(__temp.QtDataVisualization).items()
+        if not __name.startswith('_')
+    )
 elif PYSIDE6:
     from PySide6.QtDataVisualization import *
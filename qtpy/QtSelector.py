@@ -1,38 +1,55 @@
 ﻿import sys
 import os
-import importlib
 from qtpy import (
     QtWidgets,
     QtGui,
     get_env,
+    get_env_many,
     set_env,
     PythonQtValueError,
+    API_NAMES,
+    _find_spec,
 )
 
 
-api_list = [
-    api
-    for api in ("PyQt5", "PySide2", "PyQt6", "PySide6")
-    if importlib.util.find_spec(api) is not None
-]
-api_list.insert(0, "auto")
+_API_LIST = ("auto",) + tuple(
+    api for api in API_NAMES.values() if _find_spec(api) is not None
+)
+_API_INDEX = {api.lower(): index for index, api in enumerate(_API_LIST)}
+
+_SCALE_LIST = (
+    ("auto",)
+    + tuple(str(s / 10) for s in range(1, 20))
+    + tuple(str(s / 5) for s in range(10, 21))
+)
+_SCALE_INDEX = {scale: index for index, scale in enumerate(_SCALE_LIST)}
+
+_FONT_SIZE_LIST = (
+    ("default",)
+    + tuple(f"{points}" for points in range(7, 15))
+    + tuple(f"{pixels} pixels" for pixels in range(0, 81))
+)
+_FONT_SIZE_INDEX = {
+    font_size: index for index, font_size in enumerate(_FONT_SIZE_LIST)
+}
 
 
 class QtApiSelector(QtWidgets.QComboBox):
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, value=None, **kwargs):
         QtWidgets.QComboBox.__init__(self, *args, **kwargs)
-        api_list_lower = [elt.lower() for elt in api_list]
-        self.addItems(api_list)
+        self.addItems(_API_LIST)
         self.setMaxVisibleItems(self.count())
-        current_api_ = get_env("QT_API", "auto")
-        current_api = current_api_.lower()
-        if current_api not in api_list_lower:
+        if value is None:
+            value = get_env("QT_API", "auto")
+        current_api_ = value
+        index = _API_INDEX.get(current_api_.lower())
+        if index is None:
             raise PythonQtValueError(
                 f"Specified QT_API={current_api_} environement variable is not in valid options"
             )
-        self.setCurrentIndex(api_list_lower.index(current_api.lower()))
+        self.setCurrentIndex(index)
         self.setFocus()
-        self.currentTextChanged.connect(self.setApi)
+        self.activated.connect(lambda index: self.setApi(self.itemText(index)))
 
     def setApi(self, Api):
         set_env("QT_API", Api)
@@ -45,30 +62,25 @@ class QtApiSelector(QtWidgets.QComboBox):
 
 
 class QtScaleSelector(QtWidgets.QComboBox):
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, value=None, **kwargs):
         QtWidgets.QComboBox.__init__(self, *args, **kwargs)
-        scale_list = (
-            ["auto"]
-            + [str(s / 10) for s in range(1, 20)]
-            + [str(s / 5) for s in range(10, 21)]
-        )
-        scale_list_lower = [elt.lower() for elt in scale_list]
-        self.addItems(scale_list)
-        self.setMaxVisibleItems(self.count())
-        current_scale_ = get_env("QT_SCALE", "auto")
-        current_scale = current_scale_.lower()
-        if current_scale not in scale_list_lower:
+        self.addItems(_SCALE_LIST)
+        if value is None:
+            value = get_env("QT_SCALE", "auto")
+        current_scale = value.lower()
+        index = _SCALE_INDEX.get(current_scale)
+        if index is None:
             if current_scale.isdigit():
-                scale_list_lower.append(current_scale)
                 self.addItem(current_scale)
-                self.setMaxVisibleItems(self.count())
+                index = self.count() - 1
             else:
                 raise PythonQtValueError(
                     f"Specified QT_SCALE={current_scale} environement variable is not in valid options"
                 )
-        self.setCurrentIndex(scale_list_lower.index(current_scale.lower()))
+        self.setMaxVisibleItems(self.count())
+        self.setCurrentIndex(index)
         self.setFocus()
-        self.currentTextChanged.connect(self.setScale)
+        self.activated.connect(lambda index: self.setScale(self.itemText(index)))
 
     def setScale(self, scale):
         set_env("QT_SCALE", scale)
@@ -81,34 +93,25 @@ class QtScaleSelector(QtWidgets.QComboBox):
 
 
 class QtFontSizeSelector(QtWidgets.QComboBox):
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, value=None, **kwargs):
         QtWidgets.QComboBox.__init__(self, *args, **kwargs)
-        font_size_list = (
-            [
-                "default",
-            ]
-            + [f"{points}" for points in range(7, 15)]
-            + [f"{pixels} pixels" for pixels in range(0, 81)]
-        )
-        font_size_list_lower = [elt.lower() for elt in font_size_list]
-        self.addItems(font_size_list)
-        self.setMaxVisibleItems(self.count())
-        current_font_size_ = get_env("QT_FONT_SIZE", "default")
-        current_font_size = current_font_size_.lower()
-        if current_font_size not in font_size_list_lower:
-            if current_font_size not in font_size_list_lower and (
-                current_font_size.isdigit() or current_font_size.endswith(" pixels")
-            ):
-                font_size_list_lower.append(current_font_size)
+        self.addItems(_FONT_SIZE_LIST)
+        if value is None:
+            value = get_env("QT_FONT_SIZE", "default")
+        current_font_size = value.lower()
+        index = _FONT_SIZE_INDEX.get(current_font_size)
+        if index is None:
+            if current_font_size.isdigit() or current_font_size.endswith(" pixels"):
                 self.addItem(current_font_size)
-                self.setMaxVisibleItems(self.count())
+                index = self.count() - 1
             else:
                 raise PythonQtValueError(
-                    f"Specified QT_SCALE={current_font_size} environement variable is not in valid options"
+                    f"Specified QT_FONT_SIZE={current_font_size} environement variable is not in valid options"
                 )
-        self.setCurrentIndex(font_size_list_lower.index(current_font_size.lower()))
+        self.setMaxVisibleItems(self.count())
+        self.setCurrentIndex(index)
         self.setFocus()
-        self.currentTextChanged.connect(self.setFontSize)
+        self.activated.connect(lambda index: self.setFontSize(self.itemText(index)))
 
     def setFontSize(self, font_size):
         set_env("QT_FONT_SIZE", font_size)
@@ -121,11 +124,13 @@ class QtFontSizeSelector(QtWidgets.QComboBox):
 
 
 class QtFontSelector(QtWidgets.QFontComboBox):
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, value=None, **kwargs):
         QtWidgets.QFontComboBox.__init__(self, *args, **kwargs)
         self.insertItem(0, "default")
         self.setMaxVisibleItems(self.count())
-        current_font = get_env("QT_FONT", "default")
+        if value is None:
+            value = get_env("QT_FONT", "default")
+        current_font = value
         try:
             self.setCurrentText(current_font)
         except:
@@ -133,7 +138,7 @@ class QtFontSelector(QtWidgets.QFontComboBox):
             self.setMaxVisibleItems(self.count())
             self.setCurrentText(current_font)
         self.setFocus()
-        self.currentTextChanged.connect(self.setFont)
+        self.activated.connect(lambda index: self.setFont(self.itemText(index)))
 
     def setFont(self, font):
         set_env("QT_FONT", font)
@@ -154,10 +159,19 @@ class QtSelector(QtWidgets.QWidget):
             "QT_FONT": QtFontSelector,
             "QT_FONT_SIZE": QtFontSizeSelector,
         }
+        values = get_env_many(
+            selectors,
+            {
+                "QT_API": "auto",
+                "QT_SCALE": "auto",
+                "QT_FONT": "default",
+                "QT_FONT_SIZE": "default",
+            },
+        )
         self.Layout = QtWidgets.QGridLayout(self)
         row = 0
         for name, selector in selectors.items():
-            widget = selector()
+            widget = selector(value=values[name])
             self.Layout.addWidget(QtWidgets.QLabel(text=name), row, 0)
             self.Layout.addWidget(widget, row, 1)
             row += 1
@@ -7,129 +7,230 @@
 # -----------------------------------------------------------------------------
 
 """Provides widget classes and functions."""
+import importlib
 from functools import wraps
 
-from . import QT_FONT_SIZE, QT_FONT, PYQT5, PYQT6, PYSIDE2, PYSIDE6
-from ._utils import possibly_static_exec, getattr_missing_optional_dep
+from . import (
+    API_NAME,
+    QT_FONT_SIZE,
+    QT_FONT,
+    PYQT5,
+    PYQT6,
+    PYSIDE2,
+    PYSIDE6,
+    PythonQtError,
+    PythonQtValueError,
+)
+from ._utils import make_possibly_static_exec, getattr_missing_optional_dep
+
+if PYQT6:
+    from .enums_compat import promote_enums
 
 
 _missing_optional_names = {}
 
+# Names are resolved from the binding module on first access and then cached
+# in this module, so importing qtpy.QtWidgets doesn't copy its whole namespace
+_QtWidgets = importlib.import_module(f'{API_NAME}.QtWidgets')
+
+if PYQT6:
+    # Allow unscoped access for enums, also through instances of classes
+    # never accessed through this module
+    promote_enums(_QtWidgets)
+
+# Names provided by other binding modules, mapped to the module providing them
+_external_names = {}
+
+# Optional binding modules, mapped to the package that must be installed
+_optional_modules = {}
+
+_MISSING = object()
+
+
+def _patch(*names):
+    """Apply the decorated function to the given binding classes.
+
+    Patches are applied at import, so they are also in place for instances
+    whose class is never accessed through this module.
+    """
+    def decorator(func):
+        for name in names:
+            func(getattr(_QtWidgets, name))
+        return func
+    return decorator
+
+
+def _lookup(name):
+    """Get a name from the binding module providing it, if available."""
+    module_name = _external_names.get(name)
+    if module_name is None:
+        return getattr(_QtWidgets, name, _MISSING)
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as error:
+        # Don't raise an exception until the name is explicitly accessed.
+        # See https://github.com/spyder-ide/qtpy/pull/387/
+        _missing_optional_names[name] = {
+           'name': module_name,
+           'missing_package': _optional_modules.get(module_name),
+           'import_error': error,
+        }
+        return _MISSING
+    return getattr(module, name, _MISSING)
+
+
+def _public_names():
+    """Get the names made available by this module."""
+    names = [name for name in dir(_QtWidgets) if not name.startswith('_')]
+    names.extend(
+        name for name in _external_names if _lookup(name) is not _MISSING)
+    return names
+
 
 def __getattr__(name):
-    """Custom getattr to chain and wrap errors due to missing optional deps."""
-    raise getattr_missing_optional_dep(
-        name, module_name=__name__, optional_names=_missing_optional_names)
+    """Custom getattr to resolve names lazily from the binding.
+
+    Errors due to missing optional deps are chained and wrapped.
+    """
+    if name == '__all__':
+        value = _public_names()
+    elif name.startswith('__') and name.endswith('__'):
+        # Python's own probes (__path__, __wrapped__, ...) aren't Qt names
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    else:
+        value = _lookup(name)
+        if value is _MISSING:
+            if name not in _missing_optional_names:
+                raise AttributeError(
+                    f'module {__name__!r} has no attribute {name!r}')
+            raise getattr_missing_optional_dep(
+                name, module_name=__name__,
+                optional_names=_missing_optional_names)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the names of the module, including the not yet resolved ones."""
+    return sorted(set(globals()) | set(_public_names()))
+
 
 def _dir_to_directory(func):
     @wraps(func)
     def _dir_to_directory_(*args, **kwargs):
-        if "dir" in kwargs:
-            kwargs["directory"] = kwargs.pop("dir")
+        directory = kwargs.pop("dir", _MISSING)
+        if directory is not _MISSING:
+            kwargs["directory"] = directory
         return func(*args, **kwargs)
     return _dir_to_directory_
 
 def _directory_to_dir(func):
     @wraps(func)
     def _directory_to_dir_(*args, **kwargs):
-        if "directory" in kwargs:
-            kwargs["dir"] = kwargs.pop("directory")
+        directory = kwargs.pop("directory", _MISSING)
+        if directory is not _MISSING:
+            kwargs["dir"] = directory
         return func(*args, **kwargs)
     return _directory_to_dir_
 
 
-if PYQT5:
-    from PyQt5.QtWidgets import *
-elif PYQT6:
-    from PyQt6 import QtWidgets
-    from PyQt6.QtWidgets import *
-    from PyQt6.QtGui import QAction, QActionGroup, QShortcut, QFileSystemModel, QUndoCommand
-
-    # Attempt to import QOpenGLWidget, but if that fails,
-    # don't raise an exception until the name is explicitly accessed.
-    # See https://github.com/spyder-ide/qtpy/pull/387/
-    try:
-        from PyQt6.QtOpenGLWidgets import QOpenGLWidget
-    except ImportError as error:
-        _missing_optional_names['QOpenGLWidget'] = {
-           'name': 'PyQt6.QtOpenGLWidgets',
-           'missing_package': 'pyopengl',
-           'import_error': error,
-        }
+if PYQT6 or PYSIDE6:
+    # Backport items moved to QtGui and QtOpenGLWidgets in Qt6
+    for _name in ('QAction', 'QActionGroup', 'QShortcut', 'QUndoCommand'):
+        _external_names[_name] = f'{API_NAME}.QtGui'
+    if PYQT6:
+        _external_names['QFileSystemModel'] = 'PyQt6.QtGui'
+    _external_names['QOpenGLWidget'] = f'{API_NAME}.QtOpenGLWidgets'
+    _optional_modules[f'{API_NAME}.QtOpenGLWidgets'] = 'pyopengl'
+    del _name
 
     # Map missing/renamed methods
-    QTextEdit.setTabStopWidth = lambda self, *args, **kwargs: self.setTabStopDistance(*args, **kwargs)
-    QTextEdit.tabStopWidth = lambda self, *args, **kwargs: self.tabStopDistance(*args, **kwargs)
-    QTextEdit.print_ = lambda self, *args, **kwargs: self.print(*args, **kwargs)
-    QPlainTextEdit.setTabStopWidth = lambda self, *args, **kwargs: self.setTabStopDistance(*args, **kwargs)
-    QPlainTextEdit.tabStopWidth = lambda self, *args, **kwargs: self.tabStopDistance(*args, **kwargs)
-    QPlainTextEdit.print_ = lambda self, *args, **kwargs: self.print(*args, **kwargs)
-    QApplication.exec_ = lambda *args, **kwargs: possibly_static_exec(QApplication, *args, **kwargs)
-    QDialog.exec_ = lambda self, *args, **kwargs: self.exec(*args, **kwargs)
-    QMenu.exec_ = lambda *args, **kwargs: possibly_static_exec(QMenu, *args, **kwargs)
-    QLineEdit.getTextMargins = lambda self: (self.textMargins().left(), self.textMargins().top(), self.textMargins().right(), self.textMargins().bottom())
-
-    # Allow unscoped access for enums inside the QtWidgets module
-    from .enums_compat import promote_enums
-    promote_enums(QtWidgets)
-    del QtWidgets
-elif PYSIDE2:
-    from PySide2.QtWidgets import *
-elif PYSIDE6:
-    from PySide6.QtWidgets import *
-    from PySide6.QtGui import QAction, QActionGroup, QShortcut, QUndoCommand
-
-    # Attempt to import QOpenGLWidget, but if that fails,
-    # don't raise an exception until the name is explicitly accessed.
-    # See https://github.com/spyder-ide/qtpy/pull/387/
-    try:
-        from PySide6.QtOpenGLWidgets import QOpenGLWidget
-    except ImportError as error:
-        _missing_optional_names['QOpenGLWidget'] = {
-           'name': 'PySide6.QtOpenGLWidgets',
-           'missing_package': 'pyopengl',
-           'import_error': error,
-        }
+    @_patch('QTextEdit', 'QPlainTextEdit')
+    def _patch_tab_stop_width(cls):
+        cls.setTabStopWidth = lambda self, *args, **kwargs: self.setTabStopDistance(*args, **kwargs)
+        cls.tabStopWidth = lambda self, *args, **kwargs: self.tabStopDistance(*args, **kwargs)
+        if PYQT6:
+            cls.print_ = lambda self, *args, **kwargs: self.print(*args, **kwargs)
 
-    # Map missing/renamed methods
-    QTextEdit.setTabStopWidth = lambda self, *args, **kwargs: self.setTabStopDistance(*args, **kwargs)
-    QTextEdit.tabStopWidth = lambda self, *args, **kwargs: self.tabStopDistance(*args, **kwargs)
-    QPlainTextEdit.setTabStopWidth = lambda self, *args, **kwargs: self.setTabStopDistance(*args, **kwargs)
-    QPlainTextEdit.tabStopWidth = lambda self, *args, **kwargs: self.tabStopDistance(*args, **kwargs)
-    QLineEdit.getTextMargins = lambda self: (self.textMargins().left(), self.textMargins().top(), self.textMargins().right(), self.textMargins().bottom())
+    def _getTextMargins(self):
+        margins = self.textMargins()
+        return (margins.left(), margins.top(), margins.right(), margins.bottom())
+
+    @_patch('QLineEdit')
+    def _patch_get_text_margins(cls):
+        cls.getTextMargins = _getTextMargins
 
     # Map DeprecationWarning methods
-    QApplication.exec_ = lambda *args, **kwargs: possibly_static_exec(QApplication, *args, **kwargs)
-    QDialog.exec_ = lambda self, *args, **kwargs: self.exec(*args, **kwargs)
-    QMenu.exec_ = lambda *args, **kwargs: possibly_static_exec(QMenu, *args, **kwargs)
+    @_patch('QApplication', 'QMenu')
+    def _patch_static_exec_(cls):
+        cls.exec_ = make_possibly_static_exec(cls)
 
+    @_patch('QDialog')
+    def _patch_exec_(cls):
+        cls.exec_ = lambda self, *args, **kwargs: self.exec(*args, **kwargs)
 
-if PYSIDE2 or PYSIDE6:
-    QFileDialog.getExistingDirectory = _directory_to_dir(QFileDialog.getExistingDirectory)
-    QFileDialog.getOpenFileName = _directory_to_dir(QFileDialog.getOpenFileName)
-    QFileDialog.getOpenFileNames = _directory_to_dir(QFileDialog.getOpenFileNames)
-    QFileDialog.getSaveFileName = _directory_to_dir(QFileDialog.getSaveFileName)
-else:
-    QFileDialog.getExistingDirectory = _dir_to_directory(QFileDialog.getExistingDirectory)
-    QFileDialog.getOpenFileName = _dir_to_directory(QFileDialog.getOpenFileName)
-    QFileDialog.getOpenFileNames = _dir_to_directory(QFileDialog.getOpenFileNames)
-    QFileDialog.getSaveFileName = _dir_to_directory(QFileDialog.getSaveFileName)
 
+@_patch('QFileDialog')
+def _patch_directory_keyword(cls):
+    if PYSIDE2 or PYSIDE6:
+        rename_keyword = _directory_to_dir
+    else:
+        rename_keyword = _dir_to_directory
+    cls.getExistingDirectory = rename_keyword(cls.getExistingDirectory)
+    cls.getOpenFileName = rename_keyword(cls.getOpenFileName)
+    cls.getOpenFileNames = rename_keyword(cls.getOpenFileNames)
+    cls.getSaveFileName = rename_keyword(cls.getSaveFileName)
 
-if QT_FONT_SIZE != "default" or QT_FONT != "default":
-    QApplication_old_init = QApplication.__init__
+
+@_patch('QApplication')
+def _patch_application_scale(cls):
+    QApplication_old_init = cls.__init__
 
     def QApplication_new_init(self, *args, **kwargs):
+        from . import _resolve_scale
+
         QApplication_old_init(self, *args, **kwargs)
-        font = self.font()
-        if QT_FONT_SIZE != "default":
-            # print(font.pointSizeF())
-            if QT_FONT_SIZE.isdigit():
-                font.setPointSizeF(float(QT_FONT_SIZE))
-            if QT_FONT_SIZE.endswith("pixels"):
-                font.setPixelSize(int(QT_FONT_SIZE[:-6]))
-        if QT_FONT != "default":
-            font.setFamily(QT_FONT)
-        self.setFont(font)
-
-    QApplication.__init__ = QApplication_new_init
\ No newline at end of file
+        try:
+            _resolve_scale()
+        except PythonQtError:
+            # no screen yet, the scale is resolved on first use instead
+            pass
+
+    cls.__init__ = QApplication_new_init
+
+
+def _font_setters():
+    """Get the functions applying QT_FONT_SIZE and QT_FONT to a font."""
+    setters = []
+    if QT_FONT_SIZE.isdigit():
+        point_size = float(QT_FONT_SIZE)
+        setters.append(lambda font: font.setPointSizeF(point_size))
+    elif QT_FONT_SIZE.endswith("pixels") and QT_FONT_SIZE[:-6].strip().isdigit():
+        pixel_size = int(QT_FONT_SIZE[:-6])
+        setters.append(lambda font: font.setPixelSize(pixel_size))
+    elif QT_FONT_SIZE != "default":
+        raise PythonQtValueError(
+            f"Specified QT_FONT_SIZE={QT_FONT_SIZE} environment variable is not in valid options"
+        )
+    if QT_FONT != "default":
+        setters.append(lambda font: font.setFamily(QT_FONT))
+    return setters
+
+
+# Parsed once, so creating a QApplication only applies the font settings
+_FONT_SETTERS = _font_setters()
+
+if _FONT_SETTERS:
+
+    @_patch('QApplication')
+    def _patch_application_font(cls):
+        QApplication_old_init = cls.__init__
+
+        def QApplication_new_init(self, *args, **kwargs):
+            QApplication_old_init(self, *args, **kwargs)
+            font = self.font()
+            for setter in _FONT_SETTERS:
+                setter(font)
+            self.setFont(font)
+
+        cls.__init__ = QApplication_new_init
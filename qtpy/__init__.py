@@ -55,20 +55,28 @@ PySide6
 """
 
 from packaging.version import parse
+import atexit
+import functools
 import os
 import platform
 import sys
 import warnings
-import importlib
+import importlib.util
+from itertools import repeat
 
 # Version of QtPy
 __version__ = '2.4.0.dev0'
 
+# values set by set_env waiting to be saved, only the last value of each key
+# is saved when several changes happen in a row (e.g. browsing a combobox)
+_pending_env = {}
+# whether a delayed save of the pending values is already scheduled
+_env_flush_scheduled = False
+
 if os.name == "nt":
     from nt import environ as environ_nt
     import winreg
     import ctypes
-    import subprocess
 
     orignal_environ = {key.upper(): value for key, value in environ_nt.items()}
 
@@ -77,28 +85,66 @@ if os.name == "nt":
         if orignal_environ.get(key) != value:
             python_redefined_keys.add(key)
 
-    def get_env(key, default=None):
-        if key in python_redefined_keys:
-            return os.environ[key]
-        for reg_key in (
-            winreg.CreateKey(winreg.HKEY_CURRENT_USER, r"Environment"),
-            winreg.CreateKey(
-                winreg.HKEY_LOCAL_MACHINE,
-                r"System\CurrentControlSet\Control\Session Manager\Environment",
-            ),
-        ):
+    # user and system environment registry keys, opened once for all lookups
+    _HKCU_ENV = winreg.OpenKey(
+        winreg.HKEY_CURRENT_USER,
+        r"Environment",
+        0,
+        winreg.KEY_QUERY_VALUE | winreg.KEY_SET_VALUE,
+    )
+    _HKLM_ENV = winreg.OpenKey(
+        winreg.HKEY_LOCAL_MACHINE,
+        r"System\CurrentControlSet\Control\Session Manager\Environment",
+    )
+
+    @functools.lru_cache(maxsize=64)
+    def _query(key):
+        for reg_key in (_HKCU_ENV, _HKLM_ENV):
             try:
                 return winreg.QueryValueEx(reg_key, key)[0]
             except FileNotFoundError:
                 pass
+        return None
+
+    def get_env(key, default=None):
+        if key in python_redefined_keys:
+            return os.environ[key]
+        value = _query(key)
+        if value is not None:
+            return value
         return os.environ.get(key, default)  # utuile ?
 
+    _HWND_BROADCAST = 0xFFFF
+    _WM_SETTINGCHANGE = 0x001A
+    _SMTO_ABORTIFHUNG = 0x0002
+
+    def _flush_env():
+        global _env_flush_scheduled
+        _env_flush_scheduled = False
+        pending = list(_pending_env.items())
+        for key, value in pending:
+            value_type = winreg.REG_EXPAND_SZ if "%" in value else winreg.REG_SZ
+            winreg.SetValueEx(_HKCU_ENV, key, 0, value_type, value)
+            # the value is only dropped once saved, to retry it otherwise
+            del _pending_env[key]
+        if pending:
+            # notify the other processes of the change, as setx does
+            ctypes.windll.user32.SendMessageTimeoutW(
+                _HWND_BROADCAST,
+                _WM_SETTINGCHANGE,
+                0,
+                "Environment",
+                _SMTO_ABORTIFHUNG,
+                1000,
+                None,
+            )
+
     def set_env(key, value):
-        info = subprocess.STARTUPINFO()
-        info.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-        info.wShowWindow = 0  # Run Hidden
         os.environ[key] = value
-        subprocess.Popen(["setx", key, value], startupinfo=info)
+        # the process now owns the value, don't read the registry for it
+        python_redefined_keys.add(key)
+        _pending_env[key] = value
+        _schedule_env_flush()
 
     # force process to be DPI Aware avoiding Window scalinf with blur with Qt6
     # as the same effect than change pythonw.exe property to DPI Aware
@@ -120,40 +166,96 @@ elif os.name == "posix":
     # }
     env_path = os.path.expanduser("~/.config/plasma-workspace/env/QtEnvironment.sh")
     orignal_environ = dict()
+    # lines of the file, kept in memory to rewrite it without reading it,
+    # and the index of the line exporting each variable
+    _env_file_lines = []
+    _env_file_export_index = {}
     if os.path.exists(env_path):
         with open(env_path, "r") as f:
-            lines = f.readlines()
-            for i, line in enumerate(lines):
+            _env_file_lines = f.readlines()
+            for i, line in enumerate(_env_file_lines):
                 if line.startswith("export "):
-                    key, value = line[7:].strip().split("=")
+                    key, value = line[7:].strip().split("=", 1)
                     orignal_environ[key] = value
+                    _env_file_export_index.setdefault(key, i)
 
     def get_env(key, default=None):
         if key in os.environ:
             return os.environ[key]
         return orignal_environ.get(key, default)
 
+    def _flush_env():
+        global _env_flush_scheduled
+        _env_flush_scheduled = False
+        if not _pending_env:
+            return
+        lines = list(_env_file_lines)
+        export_index = dict(_env_file_export_index)
+        for key, value in _pending_env.items():
+            line = f"export {key}={value}\n"
+            index = export_index.get(key)
+            if index is not None:
+                lines[index] = line
+            else:
+                if lines and not lines[-1].endswith("\n"):
+                    lines[-1] += "\n"
+                export_index[key] = len(lines)
+                lines.append(line)
+        os.makedirs(os.path.dirname(env_path), exist_ok=True)
+        temp_path = f"{env_path}.tmp"
+        with open(temp_path, "w") as f:
+            f.writelines(lines)
+        os.replace(temp_path, env_path)
+        # the values are only dropped once saved, to retry them otherwise
+        _env_file_lines[:] = lines
+        _env_file_export_index.update(export_index)
+        _pending_env.clear()
+
     def set_env(key, value):
         os.environ[key] = value
-        env_path = os.path.expanduser("~/.config/plasma-workspace/env/QtEnvironment.sh")
-        if os.path.exists(env_path):
-            with open(env_path, "r") as f:
-                lines = f.readlines()
-                for i, line in enumerate(lines):
-                    if line.startswith(f"export {key}="):
-                        lines[i] = f"export {key}={value}\n"
-                        break
-                else:
-                    lines.append(f"export {key}={value}\n")
-        else:
-            lines = [f"export {key}={value}\n"]
-        with open(env_path, "w") as f:
-            f.writelines(lines)
+        _pending_env[key] = value
+        _schedule_env_flush()
 
 else:
     raise Exception("unknow OS")
 
 
+def get_env_many(keys, defaults=None):
+    """Get the values of several environment variables, keyed by name."""
+    if defaults is None:
+        defaults = {}
+    return {key: get_env(key, defaults.get(key)) for key in keys}
+
+
+def _schedule_env_flush():
+    """Save the pending environment values once the current changes are over."""
+    global _env_flush_scheduled
+    if _env_flush_scheduled:
+        return
+    from qtpy import QtCore
+
+    if QtCore.QCoreApplication.instance() is None:
+        _flush_env()
+    else:
+        _env_flush_scheduled = True
+        QtCore.QTimer.singleShot(500, _flush_env_from_timer)
+
+
+def _flush_env_from_timer():
+    """Save the pending environment values without raising into Qt."""
+    try:
+        _flush_env()
+    except OSError as error:
+        # the values stay pending and are saved again at exit
+        warnings.warn(
+            f"Could not save the environment variables: {error}",
+            PythonQtWarning,
+        )
+
+
+atexit.register(_flush_env)
+
+
 # disable  Qt Scaling and leave use scale all wath we decide with the scaled function
 os.environ["QT_ENABLE_HIGHDPI_SCALING"] = "0"
 os.environ["QT_USE_PHYSICAL_DPI"] = "1"
@@ -253,6 +355,9 @@ PYSIDE_VERSION_MIN = PYSIDE2_VERSION_MIN
 # Detecting if a binding was specified by the user
 binding_specified = QT_API in os.environ
 
+# Binding lookups are cached, so later probes (e.g. by QtSelector) are free
+_find_spec = functools.lru_cache(maxsize=None)(importlib.util.find_spec)
+
 API_NAMES = {'pyqt5': 'PyQt5', 'pyside2': 'PySide2',
              'pyqt6': 'PyQt6', 'pyside6': 'PySide6'}
 modules = list(API_NAMES.values())
@@ -270,11 +375,11 @@ if API == "auto":
             break
     else:
         for module in modules:
-            if importlib.util.find_spec(module) is not None:
+            if _find_spec(module) is not None:
                 API = module.lower()
                 break
-            else:
-                raise QtBindingsNotFoundError
+        else:
+            raise QtBindingsNotFoundError
 
 initial_api = API
 if API not in list(API_NAMES.keys()) + list(API_NAMES.values()):
@@ -283,89 +388,63 @@ if API not in list(API_NAMES.keys()) + list(API_NAMES.values()):
     )
 
 is_old_pyqt = is_pyqt46 = False
-QT5 = PYQT5 = True
-QT4 = QT6 = PYQT4 = PYQT6 = PYSIDE = PYSIDE2 = PYSIDE6 = False
+QT4 = PYQT4 = PYSIDE = False
 
 PYQT_VERSION = None
 PYSIDE_VERSION = None
 QT_VERSION = None
 
-if API in PYQT5_API:
-    try:
-        from PyQt5.QtCore import PYQT_VERSION_STR as PYQT_VERSION  # analysis:ignore
-        from PyQt5.QtCore import QT_VERSION_STR as QT_VERSION  # analysis:ignore
-
-        QT5 = PYQT5 = True
-
-        if sys.platform == 'darwin':
-            macos_version = parse(platform.mac_ver()[0])
-            if macos_version < parse('10.10'):
-                if parse(QT_VERSION) >= parse('5.9'):
-                    raise PythonQtError("Qt 5.9 or higher only works in "
-                                        "macOS 10.10 or higher. Your "
-                                        "program will fail in this "
-                                        "system.")
-            elif macos_version < parse('10.11'):
-                if parse(QT_VERSION) >= parse('5.11'):
-                    raise PythonQtError("Qt 5.11 or higher only works in "
-                                        "macOS 10.11 or higher. Your "
-                                        "program will fail in this "
-                                        "system.")
-
-            del macos_version
-    except ImportError:
-        API = 'pyside2'
-    else:
-        os.environ[QT_API] = API
-
-if API in PYSIDE2_API:
-    try:
-        from PySide2 import __version__ as PYSIDE_VERSION  # analysis:ignore
-        from PySide2.QtCore import __version__ as QT_VERSION  # analysis:ignore
-
-        PYQT5 = False
-        QT5 = PYSIDE2 = True
-
-        if sys.platform == 'darwin':
-            macos_version = parse(platform.mac_ver()[0])
-            if macos_version < parse('10.11'):
-                if parse(QT_VERSION) >= parse('5.11'):
-                    raise PythonQtError("Qt 5.11 or higher only works in "
-                                        "macOS 10.11 or higher. Your "
-                                        "program will fail in this "
-                                        "system.")
-
-            del macos_version
-    except ImportError:
-        API = 'pyqt6'
-    else:
-        os.environ[QT_API] = API
 
-if API in PYQT6_API:
-    try:
-        from PyQt6.QtCore import PYQT_VERSION_STR as PYQT_VERSION  # analysis:ignore
-        from PyQt6.QtCore import QT_VERSION_STR as QT_VERSION  # analysis:ignore
+def _import_binding(api):
+    """Import QtCore from the given binding and return its versions."""
+    binding = API_NAMES[api]
+    QtCore = importlib.import_module(f'{binding}.QtCore')
+    if api in PYQT5_API + PYQT6_API:
+        return QtCore.PYQT_VERSION_STR, None, QtCore.QT_VERSION_STR
+    return None, importlib.import_module(binding).__version__, QtCore.__version__
 
-        QT5 = PYQT5 = False
-        QT6 = PYQT6 = True
 
-    except ImportError:
-        API = 'pyside6'
-    else:
-        os.environ[QT_API] = API
-
-if API in PYSIDE6_API:
+# Try the selected binding first and then the following ones in API_NAMES
+# order, only importing the bindings that can be found
+apis = list(API_NAMES)
+for API in apis[apis.index(API):]:
+    binding = API_NAMES[API]
+    if binding not in sys.modules and _find_spec(binding) is None:
+        continue
     try:
-        from PySide6 import __version__ as PYSIDE_VERSION  # analysis:ignore
-        from PySide6.QtCore import __version__ as QT_VERSION  # analysis:ignore
-
-        QT5 = PYQT5 = False
-        QT6 = PYSIDE6 = True
-
+        PYQT_VERSION, PYSIDE_VERSION, QT_VERSION = _import_binding(API)
     except ImportError:
-        raise QtBindingsNotFoundError from None
-    else:
-        os.environ[QT_API] = API
+        continue
+    break
+else:
+    raise QtBindingsNotFoundError
+
+os.environ[QT_API] = API
+del apis, binding
+
+PYQT5 = API in PYQT5_API
+PYSIDE2 = API in PYSIDE2_API
+PYQT6 = API in PYQT6_API
+PYSIDE6 = API in PYSIDE6_API
+QT5 = PYQT5 or PYSIDE2
+QT6 = PYQT6 or PYSIDE6
+
+if sys.platform == 'darwin' and QT5:
+    macos_version = parse(platform.mac_ver()[0])
+    if PYQT5 and macos_version < parse('10.10'):
+        if parse(QT_VERSION) >= parse('5.9'):
+            raise PythonQtError("Qt 5.9 or higher only works in "
+                                "macOS 10.10 or higher. Your "
+                                "program will fail in this "
+                                "system.")
+    elif macos_version < parse('10.11'):
+        if parse(QT_VERSION) >= parse('5.11'):
+            raise PythonQtError("Qt 5.11 or higher only works in "
+                                "macOS 10.11 or higher. Your "
+                                "program will fail in this "
+                                "system.")
+
+    del macos_version
 
 
 # If a correct API name is passed to QT_API and it could not be found,
@@ -402,27 +481,29 @@ def _warn_old_minor_version(name, old_version, min_version):
 
 # Warn if using an End of Life or unsupported Qt API/binding minor version
 if QT_VERSION:
-    if QT5 and (parse(QT_VERSION) < parse(QT5_VERSION_MIN)):
-        _warn_old_minor_version('Qt5', QT_VERSION, QT5_VERSION_MIN)
-    elif QT6 and (parse(QT_VERSION) < parse(QT6_VERSION_MIN)):
-        _warn_old_minor_version('Qt6', QT_VERSION, QT6_VERSION_MIN)
-
-if PYQT_VERSION:
-    if PYQT5 and (parse(PYQT_VERSION) < parse(PYQT5_VERSION_MIN)):
-        _warn_old_minor_version('PyQt5', PYQT_VERSION, PYQT5_VERSION_MIN)
-    elif PYQT6 and (parse(PYQT_VERSION) < parse(PYQT6_VERSION_MIN)):
-        _warn_old_minor_version('PyQt6', PYQT_VERSION, PYQT6_VERSION_MIN)
-elif PYSIDE_VERSION:
-    if PYSIDE2 and (parse(PYSIDE_VERSION) < parse(PYSIDE2_VERSION_MIN)):
-        _warn_old_minor_version('PySide2', PYSIDE_VERSION, PYSIDE2_VERSION_MIN)
-    elif PYSIDE6 and (parse(PYSIDE_VERSION) < parse(PYSIDE6_VERSION_MIN)):
-        _warn_old_minor_version('PySide6', PYSIDE_VERSION, PYSIDE6_VERSION_MIN)
-
+    qt_version_min = QT5_VERSION_MIN if QT5 else QT6_VERSION_MIN
+    if parse(QT_VERSION) < parse(qt_version_min):
+        _warn_old_minor_version(
+            'Qt5' if QT5 else 'Qt6', QT_VERSION, qt_version_min)
+    del qt_version_min
+
+if PYQT_VERSION or PYSIDE_VERSION:
+    if PYQT5:
+        binding_name, binding_version_min = 'PyQt5', PYQT5_VERSION_MIN
+    elif PYQT6:
+        binding_name, binding_version_min = 'PyQt6', PYQT6_VERSION_MIN
+    elif PYSIDE2:
+        binding_name, binding_version_min = 'PySide2', PYSIDE2_VERSION_MIN
+    else:
+        binding_name, binding_version_min = 'PySide6', PYSIDE6_VERSION_MIN
+    binding_version = PYQT_VERSION or PYSIDE_VERSION
+    if parse(binding_version) < parse(binding_version_min):
+        _warn_old_minor_version(
+            binding_name, binding_version, binding_version_min)
+    del binding_name, binding_version_min, binding_version
 
  
 
-from qtpy import QtCore, QtWidgets
-
 eps = sys.float_info.epsilon
 
 
@@ -435,34 +516,133 @@ else:
         QT_SCALE = int(QT_SCALE)
 
 
+# skip any scaling when the scale is known to be 1
+_IDENTITY = False
+
+
+# imported on first use, so that importing qtpy doesn't load QtCore
+_QRect = None
+
+
+def _scale_qrect(obj, scale):
+    x, y, width, height = obj.getRect()
+    return _QRect(
+        round(x * scale + eps),
+        round(y * scale + eps),
+        round(width * scale + eps),
+        round(height * scale + eps),
+    )
+
+
+def _scale_int(obj, scale):
+    return int(round(obj * scale + eps))  # id somthing make 1 pixel, and scale 0.5
+
+
+def _scale_tuple(obj, scale):
+    return tuple(map(_scale, obj, repeat(scale)))
+
+
+def _scale_list(obj, scale):
+    return [_scale(elt, scale) for elt in obj]
+
+
+def _scale_other(obj, scale):  # float , QtCore.QMargins, QtCore.QSize
+    return obj * scale
+
+
+_SCALED_DISPATCH = {
+    int: _scale_int,
+    float: _scale_other,
+    tuple: _scale_tuple,
+    list: _scale_list,
+}
+
+
+def _scale_function(cls):
+    # subclasses (bool, int enums, ...) are scaled as their nearest base
+    # class, and cached so the next lookup is a single dict access
+    global _QRect
+    if _QRect is None:
+        from qtpy.QtCore import QRect as _QRect
+
+        _SCALED_DISPATCH[_QRect] = _scale_qrect
+    for base in cls.__mro__:
+        if base in _SCALED_DISPATCH:
+            function = _SCALED_DISPATCH[base]
+            break
+    else:
+        function = _scale_other
+    _SCALED_DISPATCH[cls] = function
+    return function
+
+
+def _scale(obj, scale):
+    function = _SCALED_DISPATCH.get(type(obj))
+    if function is None:
+        function = _scale_function(type(obj))
+    return function(obj, scale)
+
+
 def scaled(obj, *args):
     # scale = QtGui.QFontMetrics(QtGui.QFont()).height()/25.
-    global QT_SCALE
     if QT_SCALE is None:
-        QT_SCALE = QtWidgets.QApplication.screens()[0].logicalDotsPerInch() / 192.0
-    scale = QT_SCALE
-    if scale == 0:
-        scale
+        _resolve_scale()
     if args:
-        return scaled((obj,) + args)
-    elif scale == 1:
+        obj = (obj,) + args
+    if _IDENTITY:
         return obj
-    elif isinstance(obj, QtCore.QRect):
-        x, y, width, height = obj.getRect()
-        return QtCore.QRect(
-            round(x * scale + eps),
-            round(y * scale + eps),
-            round(width * scale + eps),
-            round(height * scale + eps),
-        )
-    elif isinstance(obj, int):
-        return int(round(obj * scale + eps))  # id somthing make 1 pixel, and scale 0.5
-    elif isinstance(obj, tuple):
-        return (scaled(elt) for elt in obj)
-    elif isinstance(obj, list):
-        return [scaled(elt) for elt in obj]
-    else:  # float , QtCore.QMargins, QtCore.QSize
-        return obj * scale
+    return _scale(obj, QT_SCALE)
+
+
+def _scaled_identity(obj, *args):
+    if args:
+        return (obj,) + args
+    return obj
+
+
+_scaled = scaled
+
+
+def _resolve_scale():
+    """Compute the scale if automatic and specialize `scaled` for it.
+
+    Called when the QApplication is created, so `qtpy.scaled` is the identity
+    function from then on when the scale is 1.
+    """
+    global QT_SCALE, _IDENTITY, scaled
+    if QT_SCALE is None:
+        from qtpy import QtWidgets
+
+        app = QtWidgets.QApplication.instance()
+        if app is None:
+            raise PythonQtError(
+                "A QApplication must be created before using scaled() "
+                "with QT_SCALE=auto"
+            )
+        screen = app.primaryScreen()
+        if screen is None:
+            raise PythonQtError(
+                "A screen must be available to use scaled() with QT_SCALE=auto"
+            )
+        QT_SCALE = screen.logicalDotsPerInch() / 192.0
+        if not app.property("qtpy_scale_watched"):
+            # the DPI is only read again when the screens change
+            for signal in (app.screenAdded, app.screenRemoved, app.primaryScreenChanged):
+                signal.connect(_invalidate_scale)
+            app.setProperty("qtpy_scale_watched", True)
+    _IDENTITY = QT_SCALE == 1
+    scaled = _scaled_identity if _IDENTITY else _scaled
+
+
+def _invalidate_scale(*args):
+    """Compute the automatic scale again on the next `scaled` call."""
+    global QT_SCALE, scaled
+    QT_SCALE = None
+    scaled = _scaled
+
+
+if QT_SCALE is not None:
+    _resolve_scale()
 
 
 if __name__ == "__main__":
@@ -46,6 +46,13 @@ def possibly_static_exec(cls, *args, **kwargs):
         return cls.exec(*args, **kwargs)
 
 
+def make_possibly_static_exec(cls):
+    """Create an `exec_` for `cls` calling `possibly_static_exec`."""
+    def exec_(*args, **kwargs):
+        return possibly_static_exec(cls, *args, **kwargs)
+    return exec_
+
+
 def possibly_static_exec_(cls, *args, **kwargs):
     """Call `self.exec` when `self` is given or a static method otherwise."""
     if not args and not kwargs:
@@ -0,0 +1,110 @@
+"""Test saving the environment variables set with qtpy.set_env."""
+import os
+
+import pytest
+
+import qtpy
+from qtpy import PythonQtWarning
+
+pytestmark = pytest.mark.skipif(
+    os.name != "posix", reason="Tests the POSIX environment file")
+
+
+@pytest.fixture
+def env_file(tmp_path, monkeypatch):
+    """Use an environment file in a temporary directory."""
+    path = tmp_path / "env" / "QtEnvironment.sh"
+    monkeypatch.setattr(qtpy, "env_path", str(path))
+    monkeypatch.setattr(qtpy, "_env_file_lines", [])
+    monkeypatch.setattr(qtpy, "_env_file_export_index", {})
+    monkeypatch.setattr(qtpy, "_pending_env", {})
+    monkeypatch.setattr(qtpy, "_env_flush_scheduled", False)
+    for key in ("QT_API", "QT_FONT"):
+        monkeypatch.delenv(key, raising=False)
+    return path
+
+
+def load_env_file(monkeypatch, path, text):
+    """Write an environment file as if it had been read at import."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    lines = text.splitlines(keepends=True)
+    export_index = {
+        line[7:].split("=", 1)[0]: index
+        for index, line in enumerate(lines)
+        if line.startswith("export ")
+    }
+    monkeypatch.setattr(qtpy, "_env_file_lines", lines)
+    monkeypatch.setattr(qtpy, "_env_file_export_index", export_index)
+
+
+@pytest.fixture
+def failing_replace(monkeypatch):
+    """Make os.replace fail until the returned list is cleared."""
+    replace = os.replace
+    failing = [True]
+
+    def _replace(src, dst):
+        if failing:
+            raise OSError("replace failed")
+        replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", _replace)
+    return failing
+
+
+def test_set_env_after_failed_save(qtbot, env_file, failing_replace):
+    """Test a save is scheduled again after the previous one failed."""
+    qtpy.set_env("QT_FONT", "Serif")
+    with pytest.warns(PythonQtWarning):
+        qtbot.waitUntil(lambda: not qtpy._env_flush_scheduled)
+    assert qtpy._pending_env == {"QT_FONT": "Serif"}
+
+    failing_replace.clear()
+    qtpy.set_env("QT_FONT", "Mono")
+    qtbot.waitUntil(lambda: not qtpy._pending_env)
+    assert env_file.read_text() == "export QT_FONT=Mono\n"
+
+
+def test_flush_env_in_place(env_file, monkeypatch):
+    """Test exports are updated in place, keeping the other lines."""
+    load_env_file(
+        monkeypatch, env_file,
+        "# Qt binding\nexport QT_API=pyqt5\n# scale\nexport QT_SCALE=1\n")
+    qtpy._pending_env["QT_API"] = "pyqt6"
+    qtpy._flush_env()
+    assert env_file.read_text() == (
+        "# Qt binding\nexport QT_API=pyqt6\n# scale\nexport QT_SCALE=1\n")
+    assert not qtpy._pending_env
+
+
+def test_flush_env_append(env_file, monkeypatch):
+    """Test new exports are appended after a last line without newline."""
+    load_env_file(
+        monkeypatch, env_file, "# Qt binding\nexport QT_API=pyqt5\nFOO=bar")
+    qtpy._pending_env["QT_FONT"] = "Serif"
+    qtpy._flush_env()
+    assert env_file.read_text() == (
+        "# Qt binding\nexport QT_API=pyqt5\nFOO=bar\nexport QT_FONT=Serif\n")
+
+    # the in memory lines are kept in sync with the file
+    qtpy._pending_env["QT_FONT"] = "Mono"
+    qtpy._flush_env()
+    assert env_file.read_text() == (
+        "# Qt binding\nexport QT_API=pyqt5\nFOO=bar\nexport QT_FONT=Mono\n")
+
+
+def test_flush_env_failed(env_file, monkeypatch, failing_replace):
+    """Test the values stay pending when the file can't be replaced."""
+    load_env_file(monkeypatch, env_file, "export QT_API=pyqt5\n")
+    qtpy._pending_env["QT_API"] = "pyqt6"
+    with pytest.raises(OSError):
+        qtpy._flush_env()
+    assert qtpy._pending_env == {"QT_API": "pyqt6"}
+    assert qtpy._env_file_lines == ["export QT_API=pyqt5\n"]
+    assert env_file.read_text() == "export QT_API=pyqt5\n"
+
+    failing_replace.clear()
+    qtpy._flush_env()
+    assert env_file.read_text() == "export QT_API=pyqt6\n"
+    assert not qtpy._pending_env
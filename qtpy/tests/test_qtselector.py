@@ -0,0 +1,78 @@
+"""Test QtSelector."""
+import pytest
+
+import qtpy
+from qtpy import PythonQtValueError, QtSelector
+
+
+@pytest.fixture
+def saves(monkeypatch):
+    """Record the saves of the environment values instead of writing them."""
+    monkeypatch.setattr(qtpy, '_pending_env', {})
+    monkeypatch.setattr(qtpy, '_env_flush_scheduled', False)
+    for key in ('QT_API', 'QT_SCALE', 'QT_FONT', 'QT_FONT_SIZE'):
+        monkeypatch.delenv(key, raising=False)
+    saved = []
+
+    def _flush_env():
+        qtpy._env_flush_scheduled = False
+        saved.append(dict(qtpy._pending_env))
+        qtpy._pending_env.clear()
+
+    monkeypatch.setattr(qtpy, '_flush_env', _flush_env)
+    return saved
+
+
+def test_selector_value(qtbot):
+    """Test the selectors show the value given to them."""
+    assert QtSelector.QtApiSelector(value='auto').currentText() == 'auto'
+    assert QtSelector.QtScaleSelector(value='1.5').currentText() == '1.5'
+    assert QtSelector.QtScaleSelector(value='3').currentText() == '3'
+    font_size_selector = QtSelector.QtFontSizeSelector(value='12 pixels')
+    assert font_size_selector.currentText() == '12 pixels'
+    with pytest.raises(PythonQtValueError):
+        QtSelector.QtApiSelector(value='bad')
+
+
+def test_selector_saves_on_activation(qtbot, saves):
+    """Test only user activations are saved, once for several of them."""
+    selector = QtSelector.QtScaleSelector(value='auto')
+    qtbot.addWidget(selector)
+    selector.setCurrentIndex(3)
+    qtbot.wait(600)
+    assert saves == []
+    assert not qtpy._pending_env
+
+    selector.activated.emit(2)
+    selector.activated.emit(5)
+    qtbot.waitUntil(lambda: len(saves) > 0)
+    qtbot.wait(600)
+    assert saves == [{'QT_SCALE': selector.itemText(5)}]
+
+
+def test_qt_selector_reads_env_once(qtbot, monkeypatch):
+    """Test QtSelector reads the environment once for all its selectors."""
+    calls = []
+
+    def get_env_many(keys, defaults=None):
+        calls.append(list(keys))
+        return {
+            'QT_API': 'auto',
+            'QT_SCALE': '1.5',
+            'QT_FONT': 'default',
+            'QT_FONT_SIZE': '12',
+        }
+
+    def get_env(key, default=None):
+        raise AssertionError(f'{key} read by a selector')
+
+    monkeypatch.setattr(QtSelector, 'get_env_many', get_env_many)
+    monkeypatch.setattr(QtSelector, 'get_env', get_env)
+    widget = QtSelector.QtSelector()
+    qtbot.addWidget(widget)
+    assert calls == [['QT_API', 'QT_SCALE', 'QT_FONT', 'QT_FONT_SIZE']]
+    texts = [
+        widget.Layout.itemAtPosition(row, 1).widget().currentText()
+        for row in range(4)
+    ]
+    assert texts == ['auto', '1.5', 'default', '12']
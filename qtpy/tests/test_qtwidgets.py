@@ -1,5 +1,7 @@
 """Test QtWidgets."""
 import contextlib
+import os
+import subprocess
 import sys
 from time import sleep
 
@@ -11,6 +13,18 @@ from qtpy.tests.utils import using_conda, not_using_conda
 
 
 
+def test_lazy_namespace():
+    """Test names of QtWidgets are resolved on access and cached."""
+    assert 'QLabel' in dir(QtWidgets)
+    assert 'QLabel' in QtWidgets.__all__
+    label_class = QtWidgets.QLabel
+    assert vars(QtWidgets)['QLabel'] is label_class
+    with pytest.raises(AttributeError):
+        QtWidgets.QNotAWidget
+    with pytest.raises(AttributeError):
+        QtWidgets.__wrapped__
+
+
 def test_qtextedit_functions(qtbot, pdf_writer):
     """Test functions mapping for QtWidgets.QTextEdit."""
     assert QtWidgets.QTextEdit.setTabStopWidth
@@ -24,9 +38,12 @@ def test_qtextedit_functions(qtbot, pdf_writer):
     assert output_path.exists()
 
 
-def test_qlineedit_functions():
+def test_qlineedit_functions(qtbot):
     """Test functions mapping for QtWidgets.QLineEdit"""
     assert QtWidgets.QLineEdit.getTextMargins
+    lineedit_widget = QtWidgets.QLineEdit(None)
+    lineedit_widget.setTextMargins(1, 2, 3, 4)
+    assert lineedit_widget.getTextMargins() == (1, 2, 3, 4)
 
 
 def test_what_moved_to_qtgui_in_qt6():
@@ -127,6 +144,16 @@ def test_enum_access():
     assert QtWidgets.QStyle.SC_SliderGroove == QtWidgets.QStyle.SubControl.SC_SliderGroove
 
 
+@pytest.mark.skipif(not PYQT6, reason="Unscoped enums are only promoted for PyQt6")
+def test_enum_access_through_instance(qtbot):
+    """Test unscoped enum access through instances of classes not named in qtpy.QtWidgets."""
+    widget = QtWidgets.QWidget()
+    expanding = widget.sizePolicy().Expanding
+    dir_icon = widget.style().SP_DirIcon
+    assert expanding == QtWidgets.QSizePolicy.Policy.Expanding
+    assert dir_icon == QtWidgets.QStyle.StandardPixmap.SP_DirIcon
+
+
 def test_opengl_imports():
     """
     Test for presence of QOpenGLWidget.
@@ -217,4 +244,38 @@ def test_qfiledialog_compat(tmp_path, qtbot, keyword, instance):
     qtbot.waitUntil(thr.isRunning, timeout=1000)
     dlg = QtWidgets.QFileDialog() if instance else QtWidgets.QFileDialog
     dlg.getExistingDirectory(**kwargs)
-    qtbot.waitUntil(thr.isFinished, timeout=3000)
\ No newline at end of file
+    qtbot.waitUntil(thr.isFinished, timeout=3000)
+
+
+def test_qt_font_size_environ():
+    """Test a bad QT_FONT_SIZE raises an error when importing QtWidgets."""
+    env = os.environ.copy()
+    env['QT_FONT_SIZE'] = 'bad'
+    cmd = """
+try:
+    from qtpy import QtWidgets
+except ValueError as exc:
+    if 'QT_FONT_SIZE' not in str(exc):
+        raise
+else:
+    raise AssertionError('QtWidgets imported despite bad QT_FONT_SIZE')
+"""
+    subprocess.check_call([sys.executable, '-c', cmd], env=env)
+
+
+@pytest.mark.parametrize(
+    "font_size, expected",
+    [("12", "12 -1"), ("12 pixels", "-1 12")],
+)
+def test_qt_font_size_applied(font_size, expected):
+    """Test QT_FONT_SIZE is applied to the font of the QApplication."""
+    env = os.environ.copy()
+    env['QT_FONT_SIZE'] = font_size
+    cmd = """
+from qtpy import QtWidgets
+app = QtWidgets.QApplication([])
+font = app.font()
+print(font.pointSize(), font.pixelSize())
+"""
+    output = subprocess.check_output([sys.executable, '-c', cmd], env=env)
+    assert output.strip().decode('utf-8').splitlines()[-1] == expected
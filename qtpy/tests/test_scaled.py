@@ -0,0 +1,92 @@
+"""Test qtpy.scaled."""
+import pytest
+
+import qtpy
+from qtpy import QtCore, QtWidgets, PythonQtError
+
+
+@pytest.fixture
+def set_scale(monkeypatch):
+    """Set QT_SCALE for a test, restoring the scaling state afterwards."""
+    def _set_scale(value):
+        monkeypatch.setattr(qtpy, 'QT_SCALE', value)
+        monkeypatch.setattr(qtpy, '_IDENTITY', False)
+        monkeypatch.setattr(qtpy, 'scaled', qtpy._scaled)
+        if value is not None:
+            qtpy._resolve_scale()
+    return _set_scale
+
+
+def test_scaled_types(set_scale):
+    """Test scaling of numbers and lists."""
+    set_scale(2)
+    assert qtpy.scaled(3) == 6
+    assert qtpy.scaled(1.5) == 3.0
+    assert qtpy.scaled([1, 2]) == [2, 4]
+
+
+def test_scaled_tuple(set_scale):
+    """Test a tuple is scaled to a tuple."""
+    set_scale(2)
+    result = qtpy.scaled((1, (2, 3)))
+    assert isinstance(result, tuple)
+    assert result == (2, (4, 6))
+
+
+def test_scaled_several_args(set_scale):
+    """Test several arguments are scaled to a tuple."""
+    set_scale(2)
+    assert qtpy.scaled(1, 2, 3) == (2, 4, 6)
+
+
+def test_scaled_identity(set_scale):
+    """Test qtpy.scaled is replaced by the identity when the scale is 1."""
+    set_scale(1)
+    assert qtpy.scaled is qtpy._scaled_identity
+    values = [1, 2]
+    assert qtpy.scaled(values) is values
+    assert qtpy.scaled(1, 2) == (1, 2)
+    # references taken before the scale was known also skip the scaling
+    assert qtpy._scaled(values) is values
+
+    set_scale(2)
+    assert qtpy.scaled is qtpy._scaled
+
+
+def test_scaled_qrect(set_scale):
+    """Test scaling of QRect, whose class is only imported on first use."""
+    set_scale(2)
+    assert qtpy.scaled(QtCore.QRect(1, 2, 3, 4)) == QtCore.QRect(2, 4, 6, 8)
+
+
+def test_scaled_auto_without_application(set_scale, monkeypatch):
+    """Test the automatic scale requires a QApplication."""
+    monkeypatch.setattr(
+        QtWidgets.QApplication, 'instance', staticmethod(lambda: None))
+    set_scale(None)
+    with pytest.raises(PythonQtError):
+        qtpy.scaled(1)
+
+
+def test_scaled_auto_without_screen(qapp, set_scale, monkeypatch):
+    """Test the automatic scale requires a screen."""
+    monkeypatch.setattr(
+        QtWidgets.QApplication, 'primaryScreen', staticmethod(lambda: None))
+    set_scale(None)
+    with pytest.raises(PythonQtError):
+        qtpy.scaled(1)
+    assert qtpy.QT_SCALE is None
+
+
+def test_scaled_auto(qapp, set_scale):
+    """Test the automatic scale is read from the primary screen."""
+    set_scale(None)
+    scale = qapp.primaryScreen().logicalDotsPerInch() / 192.0
+    assert qtpy.scaled(100) == round(100 * scale)
+    assert qtpy.QT_SCALE == scale
+
+    # the scale is computed again after a screen change
+    qtpy._invalidate_scale()
+    assert qtpy.QT_SCALE is None
+    assert qtpy.scaled is qtpy._scaled
+    assert qtpy.scaled(100) == round(100 * scale)